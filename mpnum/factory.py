@@ -5,16 +5,15 @@ from __future__ import division, print_function
 
 import functools as ft
 import itertools as it
-import collections
+import operator
+from collections.abc import Iterable
 
 import numpy as np
 from scipy.linalg import qr
-
-from six.moves import range
+from scipy.linalg.blas import get_blas_funcs, zgemm
 
 from . import mparray as mp
-from . import mpsmpo
-from .utils import global_to_local, matdot
+from .utils import global_to_local
 from .mpstruct import LocalTensors
 
 
@@ -22,30 +21,134 @@ __all__ = ['eye', 'random_local_ham', 'random_mpa', 'random_mpdo',
            'random_mps', 'random_mpo', 'zero', 'diagonal_mpa']
 
 
-def _zrandn(shape, randstate=None):
-    """Shortcut for :code:`np.random.randn(*shape) + 1.j *
-    np.random.randn(*shape)`
+def _as_randstate(randstate):
+    """Returns a source of random numbers providing `standard_normal`
+
+    :param randstate: One of
+
+        * None: Use the global state of :mod:`numpy.random`
+        * ``numpy.random.RandomState`` or ``numpy.random.Generator``
+          instance: Returned unchanged
+        * Anything else (e.g. an integer seed): Passed to
+          ``numpy.random.default_rng`` to create a new PCG64-based
+          ``numpy.random.Generator``
+
+    >>> _as_randstate(None) is np.random
+    True
+    >>> rng = np.random.RandomState(seed=42)
+    >>> _as_randstate(rng) is rng
+    True
+    >>> isinstance(_as_randstate(42), np.random.Generator)
+    True
+    """
+    if randstate is None or randstate is np.random:
+        return np.random
+    if isinstance(randstate, (np.random.RandomState, np.random.Generator)):
+        return randstate
+    return np.random.default_rng(randstate)
+
+
+def _standard_normal(randstate, shape, dtype=np.float_):
+    """Draws standard normal samples of the given real floating point dtype
 
-    :param randstate: Instance of np.radom.RandomState or None (which yields
-        the default np.random) (default None)
+    ``numpy.random.Generator`` creates single precision samples natively,
+    otherwise double precision samples are converted.
 
     """
-    randstate = randstate if randstate is not None else np.random
-    return randstate.randn(*shape) + 1.j * randstate.randn(*shape)
+    if dtype is np.float_:
+        return randstate.standard_normal(shape)
+    if isinstance(randstate, np.random.Generator):
+        return randstate.standard_normal(shape, dtype=dtype)
+    return randstate.standard_normal(shape).astype(dtype)
 
 
-def _randn(shape, randstate=None):
+def _zrandn(shape, randstate=None, dtype=np.complex_):
+    """Shortcut for :code:`np.random.randn(*shape) + 1.j *
+    np.random.randn(*shape)`
+
+    :param randstate: Instance of ``np.random.RandomState``,
+        ``np.random.Generator``, a seed or None (which yields the default
+        np.random) (default None)
+    :param dtype: ``np.complex_`` or ``np.complex64`` (default
+        ``np.complex_``)
+
+    """
+    randstate = _as_randstate(randstate)
+    shape = tuple(shape)
+    # Draw real and imaginary parts in one call (in the same order as two
+    # consecutive calls would) and write them directly into the result
+    buf = _standard_normal(randstate, (2,) + shape, _real_dtypes[dtype])
+    out = np.empty(shape, dtype=dtype)
+    out.real = buf[0]
+    out.imag = buf[1]
+    return out
+
+
+def _randn(shape, randstate=None, dtype=np.float_):
     """Shortcut for :code:`np.random.randn(*shape)`
 
-    :param randstate: Instance of np.radom.RandomState or None (which yields
-        the default np.random) (default None)
+    :param randstate: Instance of ``np.random.RandomState``,
+        ``np.random.Generator``, a seed or None (which yields the default
+        np.random) (default None)
+    :param dtype: ``np.float_`` or ``np.float32`` (default ``np.float_``)
 
     """
-    randstate = randstate if randstate is not None else np.random
-    return randstate.randn(*shape)
+    randstate = _as_randstate(randstate)
+    return _standard_normal(randstate, tuple(shape), dtype)
+
 
+# Floating point type of the real and imaginary parts
+_real_dtypes = {np.float_: np.float_, np.complex_: np.float_,
+                np.float32: np.float32, np.complex64: np.float32}
+_randfuncs = {np.float_: _randn, np.complex_: _zrandn,
+              np.float32: ft.partial(_randn, dtype=np.float32),
+              np.complex64: ft.partial(_zrandn, dtype=np.complex64)}
 
-_randfuncs = {np.float_: _randn, np.complex_: _zrandn}
+
+def _randn_ltens(shapes, randstate=None, dtype=np.float_):
+    """Returns a list of random arrays with the given shapes. For complex
+    dtypes, all entries are drawn with a single call to the random number
+    generator into a single buffer.
+
+    The result is the same as ``[_randfuncs[dtype](shape, randstate) for
+    shape in shapes]``.
+
+    :param shapes: List of shapes
+    :param randstate: Instance of ``np.random.RandomState``,
+        ``np.random.Generator``, a seed or None (which yields the default
+        np.random) (default None)
+    :param dtype: One of the keys of ``_randfuncs`` (default ``np.float_``)
+
+    >>> rng = np.random.RandomState(seed=42)
+    >>> arrays = _randn_ltens([(1, 2, 3), (3, 2, 1)], rng, np.complex_)
+    >>> rng = np.random.RandomState(seed=42)
+    >>> all(np.array_equal(x, _zrandn(x.shape, rng)) for x in arrays)
+    True
+    """
+    if dtype not in _randfuncs:
+        raise ValueError("Unsupported dtype {!r}".format(dtype))
+    randstate = _as_randstate(randstate)
+    real_dtype = _real_dtypes[dtype]
+    if dtype is real_dtype:
+        # Slicing a single buffer costs about as much per site as drawing
+        # each local tensor separately, which yields the same samples
+        return [_standard_normal(randstate, shape, real_dtype)
+                for shape in shapes]
+
+    shapes = [tuple(shape) for shape in shapes]
+    offsets = list(it.accumulate(
+        [0] + [ft.reduce(operator.mul, shape, 1) for shape in shapes]))
+    buf = _standard_normal(randstate, 2 * offsets[-1], real_dtype)
+    # `_zrandn` draws all real parts of an array before the imaginary
+    # parts, so the segment [2 * start, 2 * stop) of `buf` contains the
+    # real and imaginary parts of the entries [start, stop)
+    flat = np.empty(offsets[-1], dtype=dtype)
+    real, imag = flat.real, flat.imag
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        real[start:stop] = buf[2 * start:start + stop]
+        imag[start:stop] = buf[start + stop:2 * stop]
+    return [flat[start:stop].reshape(shape)
+            for start, stop, shape in zip(offsets[:-1], offsets[1:], shapes)]
 
 
 def _random_vec(sites, ldim, randstate=None, dtype=np.complex_):
@@ -55,7 +158,8 @@ def _random_vec(sites, ldim, randstate=None, dtype=np.complex_):
 
     :param sites: Number of local sites
     :param ldim: Local ldimension
-    :param randstate: numpy.random.RandomState instance or None
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :returns: numpy.ndarray of shape (ldim,) * sites
 
     >>> psi = _random_vec(5, 2); psi.shape
@@ -65,12 +169,15 @@ def _random_vec(sites, ldim, randstate=None, dtype=np.complex_):
     """
     shape = (ldim, ) * sites
     psi = _randfuncs[dtype](shape, randstate=randstate)
-    psi /= np.linalg.norm(psi)
+    # psi is contiguous, so ravel() returns a view and BLAS nrm2 avoids the
+    # dispatch overhead of np.linalg.norm
+    flat = psi.ravel()
+    flat *= 1 / get_blas_funcs('nrm2', (flat,))(flat)
     return psi
 
 
 def _random_op(sites, ldim, hermitian=False, normalized=False, randstate=None,
-               dtype=np.complex_):
+               dtype=np.complex_, count=None):
     """Returns a random operator  of shape (ldim,ldim) * sites with local
     dimension `ldim` living on `sites` sites in global form.
 
@@ -78,18 +185,27 @@ def _random_op(sites, ldim, hermitian=False, normalized=False, randstate=None,
     :param ldim: Local ldimension
     :param hermitian: Return only the hermitian part (default False)
     :param normalized: Normalize to Frobenius norm=1 (default False)
-    :param randstate: numpy.random.RandomState instance or None
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
+    :param count: If not None, return an array of shape
+        `(count,) + (ldim, ldim) * sites` containing `count` independent
+        operators (default None)
     :returns: numpy.ndarray of shape (ldim,ldim) * sites
 
     >>> A = _random_op(3, 2); A.shape
     (2, 2, 2, 2, 2, 2)
+    >>> A = _random_op(2, 2, count=3); A.shape
+    (3, 2, 2, 2, 2)
     """
-    op = _randfuncs[dtype]((ldim**sites,) * 2, randstate=randstate)
+    shape = (ldim**sites,) * 2
+    shape = shape if count is None else (count,) + shape
+    op = _randfuncs[dtype](shape, randstate=randstate)
     if hermitian:
-        op += np.transpose(op).conj()
+        # op.conj() is the only temporary, the sum is written back to op
+        np.add(op, op.conj().swapaxes(-1, -2), out=op)
     if normalized:
-        op /= np.linalg.norm(op)
-    return op.reshape((ldim,) * 2 * sites)
+        op /= np.linalg.norm(op, axis=(-2, -1), keepdims=True)
+    return op.reshape(shape[:-2] + (ldim,) * 2 * sites)
 
 
 def _random_state(sites, ldim, randstate=None):
@@ -101,7 +217,8 @@ def _random_state(sites, ldim, randstate=None):
 
     :param sites: Number of local sites
     :param ldim: Local ldimension
-    :param randstate: numpy.random.RandomState instance or None
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :returns: numpy.ndarray of shape (ldim, ldim) * sites
 
     >>> from numpy.linalg import eigvalsh
@@ -114,7 +231,7 @@ def _random_state(sites, ldim, randstate=None):
     shape = (ldim**sites, ldim**sites)
     mat = _zrandn(shape, randstate=randstate)
     rho = np.conj(mat.T).dot(mat)
-    rho /= np.trace(rho)
+    rho *= 1 / np.trace(rho).real
     return rho.reshape((ldim,) * 2 * sites)
 
 
@@ -122,6 +239,18 @@ def _random_state(sites, ldim, randstate=None):
 #  Factory functions for MPArrays  #
 ####################################
 
+def _norm(mpa):
+    """Returns :code:`mp.norm(mpa)` without changing `mpa`
+
+    :func:`mpnum.mparray.norm` canonicalizes its argument in place, but
+    this only replaces local tensors and never writes to them. Therefore,
+    it suffices to pass a new MPA sharing the (read-only) local tensors of
+    `mpa` instead of a deep copy.
+
+    """
+    return mp.norm(mp.MPArray(LocalTensors(mpa.lt, cform=mpa.canonical_form)))
+
+
 def _generate(sites, ldim, rank, func, force_rank):
     """Returns a matrix product operator with identical number and dimensions
     of the physical legs. The local tensors are generated using `func`
@@ -142,22 +271,22 @@ def _generate(sites, ldim, rank, func, force_rank):
           have exactly this as `ranks`
 
     :param func: Generator function for local tensors, should accept
-        shape as tuple in first argument and should return
-        numpy.ndarray of given shape
+        a list of shapes (one tuple per site) in first argument and should
+        return an iterable of numpy.ndarray of these shapes
     :param force_rank: If True, the rank is exaclty `rank`.
         Otherwise, it might be reduced if we reach the maximum sensible rank.
     :returns: randomly choosen matrix product array
 
     """
     # If ldim is passed as scalar, make it 1-element tuple.
-    ldim = tuple(ldim) if isinstance(ldim, collections.abc.Iterable) else (ldim,)
+    ldim = tuple(ldim) if isinstance(ldim, Iterable) else (ldim,)
     # If ldim[0] is not iterable, we want the same physical legs on
     # all sites.
-    if not isinstance(ldim[0], collections.abc.Iterable):
+    if not isinstance(ldim[0], Iterable):
         ldim = (ldim,) * sites
     # If rank is not iterable, we want the same rank
     # everywhere.
-    if not isinstance(rank, collections.abc.Iterable):
+    if not isinstance(rank, Iterable):
         rank = (rank,) * (sites - 1)
     else:
         rank = tuple(rank)
@@ -169,9 +298,9 @@ def _generate(sites, ldim, rank, func, force_rank):
     assert len(rank) == sites - 1
 
     rank = (1,) + rank + (1,)
-    ltens = (func((rank[n],) + tuple(ld) + (rank[n + 1],))
-             for n, ld in enumerate(ldim))
-    return mp.MPArray(ltens)
+    shapes = [(rank[n],) + tuple(ld) + (rank[n + 1],)
+              for n, ld in enumerate(ldim)]
+    return mp.MPArray(func(shapes))
 
 
 def random_mpa(sites, ldim, rank, randstate=None, normalized=False,
@@ -192,13 +321,14 @@ def random_mpa(sites, ldim, rank, randstate=None, normalized=False,
         * iterable of length :code:`sites - 1`: Generated MPA will
           have exactly this as `ranks`
 
-    :param randstate: numpy.random.RandomState instance or None
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :param normalized: Resulting `mpa` has `mp.norm(mpa) == 1`
     :param force_rank: If True, the rank is exaclty `rank`.
         Otherwise, it might be reduced if we reach the maximum sensible rank.
     :param dtype: Type of the returned MPA. Currently only
-        ``np.float_`` and ``np.complex_`` are implemented (default:
-        ``np.float_``, i.e. real values).
+        ``np.float_``, ``np.complex_``, ``np.float32`` and ``np.complex64``
+        are implemented (default: ``np.float_``, i.e. real values).
 
     :returns: Randomly choosen matrix product array
 
@@ -231,14 +361,14 @@ def random_mpa(sites, ldim, rank, randstate=None, normalized=False,
            [-0.32652114+0.51490923j, -0.32222320-0.32675463j]])
 
     """
-    randfun = ft.partial(_randfuncs[dtype], randstate=randstate)
+    randfun = ft.partial(_randn_ltens, randstate=randstate, dtype=dtype)
     mpa = _generate(sites, ldim, rank, randfun, force_rank)
     if normalized:
-        mpa /= mp.norm(mpa.copy())
+        mpa /= _norm(mpa)
     return mpa
 
 
-def zero(sites, ldim, rank, force_rank=False, dtype=float):
+def zero(sites, ldim, rank, force_rank=False, dtype=float, fill=True):
     """Returns a MPA with localtensors beeing zero (but of given shape)
 
     :param sites: Number of sites
@@ -254,10 +384,22 @@ def zero(sites, ldim, rank, force_rank=False, dtype=float):
     :param force_rank: If True, the rank is exaclty `rank`.
         Otherwise, it might be reduced if we reach the maximum sensible rank.
     :param dtype: Specify dtype of underlying np.ndarray data structure
+    :param fill: If False, the local tensors are allocated with
+        :func:`numpy.empty` and are not initialized. Use this if the MPA is
+        only a placeholder for local tensors which will be overwritten
+        anyway (default True)
     :returns: Representation of the zero-array as MPA
 
+    >>> zero(3, 2, 4).ranks
+    (2, 2)
+    >>> zero(3, 2, 4, fill=False).shape
+    ((2,), (2,), (2,))
     """
-    return _generate(sites, ldim, rank, ft.partial(np.zeros, dtype=dtype), force_rank)
+    alloc = np.zeros if fill else np.empty
+    return _generate(sites, ldim, rank,
+                     lambda shapes: (alloc(shape, dtype=dtype)
+                                     for shape in shapes),
+                     force_rank)
 
 
 def eye(sites, ldim):
@@ -274,12 +416,12 @@ def eye(sites, ldim):
     >>> I.shape
     ((3, 3), (4, 4), (5, 5))
     """
-    if isinstance(ldim, collections.abc.Iterable):
+    if isinstance(ldim, Iterable):
         ldim = tuple(ldim)
         assert len(ldim) == sites
-    else:
-        ldim = it.repeat(ldim, sites)
-    return mp.MPArray.from_kron(map(np.eye, ldim))
+        return mp.MPArray.from_kron(map(np.eye, ldim))
+    # All sites share the same (read-only) local tensor
+    return mp.MPArray.from_kron(it.repeat(np.eye(ldim), sites))
 
 
 def diagonal_mpa(entries, sites):
@@ -301,8 +443,11 @@ def diagonal_mpa(entries, sites):
     ldim = len(entries)
     leftmost_ltens = np.eye(ldim).reshape((1, ldim, ldim))
     rightmost_ltens = np.diag(entries).reshape((ldim, ldim, 1))
+    # The center tensor is shared by all center sites, so it is only
+    # allocated once
+    idx = np.arange(ldim)
     center_ltens = np.zeros((ldim,) * 3)
-    np.fill_diagonal(center_ltens, 1)
+    center_ltens[idx, idx, idx] = 1
     ltens = it.chain((leftmost_ltens,), it.repeat(center_ltens, sites - 2),
                      (rightmost_ltens,))
 
@@ -313,17 +458,20 @@ def diagonal_mpa(entries, sites):
 #  More physical stuff  #
 #########################
 def random_mpo(sites, ldim, rank, randstate=None, hermitian=False,
-               normalized=True, force_rank=False):
+               normalized=True, force_rank=False, dtype=np.complex_):
     """Returns an hermitian MPO with randomly choosen local tensors
 
     :param sites: Number of sites
     :param ldim: Local dimension
     :param rank: Rank
-    :param randstate: numpy.random.RandomState instance or None
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :param hermitian: Is the operator supposed to be hermitian
     :param normalized: Operator should have unit norm
     :param force_rank: If True, the rank is exaclty `rank`.
         Otherwise, it might be reduced if we reach the maximum sensible rank.
+    :param dtype: Type of the returned MPO, see :func:`random_mpa`
+        (default: ``np.complex_``)
     :returns: randomly choosen matrix product operator
 
     >>> mpo = random_mpo(4, 2, 10, force_rank=True)
@@ -334,29 +482,31 @@ def random_mpo(sites, ldim, rank, randstate=None, hermitian=False,
 
     """
     mpo = random_mpa(sites, (ldim,) * 2, rank, randstate=randstate,
-                     force_rank=force_rank, dtype=np.complex_)
+                     force_rank=force_rank, dtype=dtype)
 
     if hermitian:
         # make mpa Herimitan in place, without increasing rank:
         ltens = (l + l.swapaxes(1, 2).conj() for l in mpo.lt)
         mpo = mp.MPArray(ltens)
     if normalized:
-        # we do this with a copy to ensure the returned state is not
-        # normalized
-        mpo /= mp.norm(mpo.copy())
+        mpo /= _norm(mpo)
 
     return mpo
 
 
-def random_mps(sites, ldim, rank, randstate=None, force_rank=False):
+def random_mps(sites, ldim, rank, randstate=None, force_rank=False,
+               dtype=np.complex_):
     """Returns a randomly choosen normalized matrix product state
 
     :param sites: Number of sites
     :param ldim: Local dimension
     :param rank: Rank
-    :param randstate: numpy.random.RandomState instance or None
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :param force_rank: If True, the rank is exaclty `rank`.
         Otherwise, it might be reduced if we reach the maximum sensible rank.
+    :param dtype: Type of the returned MPS, see :func:`random_mpa`
+        (default: ``np.complex_``)
     :returns: randomly choosen matrix product (pure) state
 
     >>> mps = random_mps(4, 2, 10, force_rank=True)
@@ -369,7 +519,22 @@ def random_mps(sites, ldim, rank, randstate=None, force_rank=False):
 
     """
     return random_mpa(sites, ldim, rank, normalized=True, randstate=randstate,
-                      force_rank=force_rank, dtype=np.complex_)
+                      force_rank=force_rank, dtype=dtype)
+
+
+def _adj_dot(a, b):
+    """Returns :code:`np.dot(a.conj().T, b)` for complex128 matrices without
+    computing the conjugate transpose of `a` explicitly.
+
+    We let BLAS compute the transpose :code:`b.T . a.conj()` of the product,
+    which only requires the Fortran-ordered views `b.T` and `a.T` of
+    C-ordered inputs and gives a C-ordered result after transposition.
+
+    >>> a, b = _zrandn((3, 3)), _zrandn((3, 5))
+    >>> np.allclose(_adj_dot(a, b), np.dot(a.conj().T, b))
+    True
+    """
+    return zgemm(1.0, b.T, a.T, trans_b=2).T
 
 
 def random_mpdo(sites, ldim, rank, randstate=np.random):
@@ -379,7 +544,8 @@ def random_mpdo(sites, ldim, rank, randstate=np.random):
     :param sites: Number of sites
     :param ldim: Local dimension
     :param rank: Rank
-    :param randstate: numpy.random.RandomState instance
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :returns: randomly choosen classicaly correlated matrix product density op.
 
     >>> rho = random_mpdo(4, 2, 4)
@@ -389,17 +555,33 @@ def random_mpdo(sites, ldim, rank, randstate=np.random):
     (0, 4)
 
     """
+    randstate = _as_randstate(randstate)
     # generate density matrix as a mixture of `rank` pure product states
-    psis = [random_mps(sites, ldim, 1, randstate=randstate) for _ in range(rank)]
-    weights = (lambda x: x / np.sum(x))(randstate.rand(rank))
-    rho = mp.sumup(mpsmpo.mps_to_mpo(psi) * weight
-                   for weight, psi in zip(weights, psis))
-
-    # Scramble the local tensors
-    for n, rank in enumerate(rho.ranks):
-        unitary = _unitary_haar(rank, randstate)
-        rho.lt[n] = matdot(rho.lt[n], unitary)
-        rho.lt[n + 1] = matdot(np.transpose(unitary).conj(), rho.lt[n + 1])
+    psis = _zrandn((sites, rank, ldim), randstate)
+    psis /= np.linalg.norm(psis, axis=-1, keepdims=True)
+    weights = (lambda x: x / np.sum(x))(randstate.random(rank))
+    # projs[n, r] is the local density matrix of the r-th state on site n
+    projs = psis[..., :, None] * psis[..., None, :].conj()
+
+    if sites == 1:
+        rho = np.tensordot(weights, projs[0], axes=(0, 0))
+        return mp.MPArray([rho[None, ..., None]])
+
+    # The mixture is block diagonal in the virtual legs with one block per
+    # product state. We scramble it by inserting U_n U_n^H with Haar random
+    # unitaries U_n on each bond and contract U_{n-1}^H and U_n into the
+    # local tensor of site n in a single pass. Due to the block diagonal
+    # structure, the right multiplication with U_n reduces to a broadcast.
+    unitaries = _unitary_haar(rank, randstate, count=sites - 1)
+    ltens = [np.tensordot(weights[:, None, None] * projs[0], unitaries[0],
+                          axes=(0, 0))[None]]
+    for n in range(1, sites - 1):
+        right = projs[n][..., None] * unitaries[n][:, None, None, :]
+        left = _adj_dot(unitaries[n - 1], right.reshape((rank, -1)))
+        ltens.append(left.reshape((rank, ldim, ldim, rank)))
+    left = _adj_dot(unitaries[-1], projs[-1].reshape((rank, -1)))
+    ltens.append(left.reshape((rank, ldim, ldim, 1)))
+    rho = mp.MPArray(ltens)
 
     rho /= mp.trace(rho)
     return rho
@@ -413,30 +595,65 @@ def random_local_ham(sites, ldim=2, intlen=2, randstate=None):
     :param sites: Number of sites
     :param ldim: Local dimension
     :param intlen: Interaction length of the local Hamiltonians
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
     :returns: MPA representation of the global Hamiltonian
 
+    >>> ham = random_local_ham(4, randstate=42)
+    >>> ham.shape
+    ((2, 2), (2, 2), (2, 2), (2, 2))
+    >>> ham_array = ham.to_array_global().reshape((16, 16))
+    >>> np.allclose(ham_array, ham_array.conj().T)
+    True
     """
-    def get_local_ham():
-        op = _random_op(intlen, ldim, hermitian=True, normalized=True)
-        op = global_to_local(op, sites=intlen)
-        return mp.MPArray.from_array(op, ndims=2)
-
     assert sites >= intlen
-    local_hams = [get_local_ham() for _ in range(sites + 1 - intlen)]
+    # Sample all local Hamiltonians at once
+    ops = _random_op(intlen, ldim, hermitian=True, normalized=True,
+                     randstate=randstate, count=sites + 1 - intlen)
+    ops = global_to_local(ops, sites=intlen, left_skip=1)
+    local_hams = [mp.MPArray.from_array(op, ndims=2) for op in ops]
     return mp.local_sum(local_hams)
 
 
-def _unitary_haar(dim, randstate=None):
+# np.linalg.qr supports stacks of matrices since NumPy 1.22
+_STACKED_QR = np.lib.NumpyVersion(np.__version__) >= '1.22.0'
+
+
+def _unitary_haar(dim, randstate=None, count=None):
     """Returns a sample from the Haar measure of the unitary group of given
     dimension.
 
     :param int dim: Dimension
-    :param randn: Function to create real N(0,1) distributed random variables.
-        It should take the shape of the output as numpy.random.randn does
-        (default: numpy.random.randn)
+    :param randstate: numpy.random.RandomState or numpy.random.Generator
+        instance, a seed or None
+    :param count: If not None, return an array of shape `(count, dim, dim)`
+        containing `count` independent samples (default None)
+
+    >>> u = _unitary_haar(3, count=2); u.shape
+    (2, 3, 3)
+    >>> np.allclose(np.matmul(u, u.conj().swapaxes(1, 2)), np.eye(3))
+    True
     """
-    z = _zrandn((dim, dim), randstate) / np.sqrt(2.0)
-    q, r = qr(z)
-    d = np.diagonal(r)
-    ph = d / np.abs(d)
-    return q * ph
+    # The distribution of q neither depends on the scale of z nor changes
+    # under transposition. Using the Fortran-ordered transposes (and skipping
+    # the 1 / sqrt(2) scaling) allows LAPACK to work on z in place, which
+    # matters since the wrapper overhead dominates for small `dim`.
+    if count is None:
+        z = _zrandn((dim, dim), randstate).T
+        q, r = qr(z, overwrite_a=True, check_finite=False)
+        d = np.diagonal(r)
+        q *= d / np.abs(d)
+        return q
+
+    z = _zrandn((count, dim, dim), randstate).swapaxes(1, 2)
+    if count > 1 and _STACKED_QR:
+        q, r = np.linalg.qr(z)
+    else:
+        q, r = np.empty_like(z), np.empty_like(z)
+        for n, mat in enumerate(z):
+            q[n], r[n] = qr(mat, overwrite_a=True, check_finite=False)
+    # Fix the phases of the columns of q such that diag(r) is positive. Note
+    # that np.sign(d) returns d / |d| for complex d only since NumPy 2.0.
+    d = np.diagonal(r, axis1=1, axis2=2)
+    q *= (d / np.abs(d))[:, None, :]
+    return q
@@ -65,6 +65,7 @@ class LocalTensors(object):
         lcanonical, rcanonical = cform
         self._lcanonical = lcanonical or 0
         self._rcanonical = rcanonical or len(self._ltens)
+        self._version = 0
 
         assert len(self._ltens) > 0
         assert 0 <= self._lcanonical < len(self._ltens)
@@ -88,6 +89,7 @@ class LocalTensors(object):
         and NO slices.
         """
         self._ltens[index] = tens
+        self._version += 1
         # If a canonical tensor is set next to a slice in canonical form,
         # the size of the canonical slice will increase by one
         # (equality case; first argument to max/min). If a canoical
@@ -186,6 +188,17 @@ class LocalTensors(object):
         """
         return self._lcanonical, self._rcanonical
 
+    @property
+    def version(self):
+        """Counter which is incremented whenever a local tensor is replaced.
+
+        Allows to cache quantities computed from the local tensors: These
+        remain valid as long as :py:attr:`version` does not change (arrays
+        obtained from :class:`LocalTensors` are read-only).
+
+        """
+        return self._version
+
     @property
     def shape(self):
         """List of tuples with the dimensions of each tensor leg at each site"""
@@ -142,6 +142,7 @@ import numpy as np
 import mpnum.factory as factory
 import mpnum.mparray as mp
 import mpnum.mpsmpo as mpsmpo
+from ..mpstruct import LocalTensors
 from ..utils.pmf import project_pmf
 
 
@@ -192,6 +193,10 @@ class MPPovm(mp.MPArray):
         # :func:`MPPovm.unpack_samples`).
         assert all(dim <= 255 for dim in self.outdims), \
             "Maximal outcome dimension 255 exceeded: {!r}".format(self.outdims)
+        # Local tensors of `self` and their version for which the local
+        # tensors of the probability map have been computed, see
+        # :func:`MPPovm.probability_map`
+        self._pmap_cache = (None, None, ())
 
     @property
     def outdims(self):
@@ -243,11 +248,22 @@ class MPPovm(mp.MPArray):
         produces the POVM probabilities as MPA (similar to
         :func:`mpnum.povm.localpovm.POVM.probability_map`).
 
+        The local tensors of the map are cached and only recomputed if
+        local tensors of `self` have been replaced in the meantime.
+
         """
-        # See :func:`.localpovm.POVM.probability_map` for explanation
-        # of the transpose.
-        return self.transpose((0, 2, 1)).reshape(
-            (pdim[0], -1) for pdim in self.shape)
+        cached_lt, cached_version, pmap_ltens = self._pmap_cache
+        if self.lt is not cached_lt or self.lt.version != cached_version:
+            # See :func:`.localpovm.POVM.probability_map` for explanation
+            # of the transpose. Transpose and reshape each local tensor in
+            # one go instead of building an intermediate MPPovm.
+            pmap_ltens = tuple(lt.transpose((0, 1, 3, 2, 4))
+                               .reshape(lt.shape[:2] + (-1, lt.shape[-1]))
+                               for lt in self.lt)
+            self._pmap_cache = (self.lt, self.lt.version, pmap_ltens)
+        # Return a new instance each time such that in-place operations on
+        # the result cannot change the cache
+        return mp.MPArray(LocalTensors(pmap_ltens, cform=self.canonical_form))
 
     @classmethod
     def from_local_povm(cls, lelems, width):
@@ -372,25 +388,26 @@ class MPPovm(mp.MPArray):
             elif all(pleg == 2 for pleg in mpa.ndims):
                 mode = 'mpdo'
 
-        pmap = self.probability_map
-
         if mode == 'mps':
-            for psi_red in mpsmpo.reductions_mps_as_pmps(mpa, len(self)):
-                rho_red = mpsmpo.pmps_to_mpo(psi_red)
-                yield mp.dot(pmap, rho_red.ravel())
-            return
+            reductions = (mpsmpo.pmps_to_mpo(psi_red) for psi_red in
+                          mpsmpo.reductions_mps_as_pmps(mpa, len(self)))
         elif mode == 'mpdo':
-            for rho_red in mpsmpo.reductions_mpo(mpa, len(self)):
-                yield mp.dot(pmap, rho_red.ravel())
-            return
+            reductions = mpsmpo.reductions_mpo(mpa, len(self))
         elif mode == 'pmps':
-            for psi_red in mpsmpo.reductions_pmps(mpa, len(self)):
-                rho_red = mpsmpo.pmps_to_mpo(psi_red)
-                yield mp.dot(pmap, rho_red.ravel())
-            return
+            reductions = (mpsmpo.pmps_to_mpo(psi_red) for psi_red in
+                          mpsmpo.reductions_pmps(mpa, len(self)))
         else:
             raise ValueError("Could not understand data dype.")
 
+        # Same as mp.dot(self.probability_map, rho_red.ravel()), but we
+        # contract the local tensors directly instead of building the
+        # raveled MPA for each reduced state
+        pmap_ltens = tuple(self.probability_map.lt)
+        for rho_red in reductions:
+            yield mp.MPArray([_probability_map_dot(pmap_lt, rho_lt)
+                              for pmap_lt, rho_lt in zip(pmap_ltens,
+                                                         rho_red.lt)])
+
     def pmf(self, state, mode='auto'):
         """Compute the POVM's probability mass function for `state`
 
@@ -1187,6 +1204,24 @@ class MPPovm(mp.MPArray):
                 n_samples_used.reshape(self.nsoutdims))
 
 
+def _probability_map_dot(pmap_lt, rho_lt):
+    """Local tensor of ``mp.dot(pmap, rho.ravel())``
+
+    :param pmap_lt: Local tensor of :func:`MPPovm.probability_map` with
+        shape ``(a, outdim, hdim**2, b)``
+    :param rho_lt: Local tensor of an MPO with shape ``(c, hdim, hdim, d)``
+    :returns: Local tensor with shape ``(a * c, outdim, b * d)``
+
+    """
+    left, right = rho_lt.shape[0], rho_lt.shape[-1]
+    res = np.tensordot(pmap_lt, rho_lt.reshape((left, -1, right)),
+                       axes=(2, 1))
+    # 0 pmap left, 1 outcome, 2 pmap right, 3 rho left, 4 rho right
+    res = res.transpose((0, 3, 1, 2, 4))
+    s = res.shape
+    return res.reshape((s[0] * s[1], s[2], s[3] * s[4]))
+
+
 class MPPovmList:
 
     """A list of :class:`Matrix Product POVMs <MPPovm>`
@@ -96,7 +96,7 @@ def block_diag(summands, axes=(0, 1)):
     for array, shape in zip(summands, shapes):
         endpos = startpos + shape
         pos = [slice(start, end) for start, end in zip(startpos, endpos)]
-        res[pos] += array
+        res[tuple(pos)] += array
         startpos = endpos
 
     old_axes_order = np.argsort(axes_order)
@@ -31,7 +31,7 @@ except:
 
 _install_requires = [
     'SciPy>=0.15',
-    'NumPy>=1.5.1',
+    'NumPy>=1.17',
     'six>=1.0'
 ]
 
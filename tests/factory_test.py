@@ -5,17 +5,23 @@ from __future__ import division, print_function
 
 import numpy as np
 import pytest as pt
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
+import mpnum as mp
 import mpnum.factory as factory
 from mpnum._testing import assert_correct_normalization
 
 
-@pt.mark.parametrize('nr_sites, local_dim, rank', [(2, 3, 3), (3, 2, 4),
+@pt.mark.parametrize('nr_sites, local_dim, rank', [(1, 3, 3), (2, 3, 3),
+                                                   (2, 2, 3), (3, 2, 4),
                                                    (6, 2, 4), (4, 3, 5),
-                                                   (5, 2, 1)])
+                                                   (4, 2, 5), (5, 2, 1)])
 def test_mpdo_positivity(nr_sites, local_dim, rank, rgen):
     rho = factory.random_mpdo(nr_sites, local_dim, rank, rgen)
+    assert rho.shape == ((local_dim, local_dim),) * nr_sites
+    assert rho.ranks == (rank,) * (nr_sites - 1)
+    assert abs(mp.trace(rho) - 1) < 1e-10
+
     rho_dense = rho.to_array_global().reshape((local_dim**nr_sites,) * 2)
 
     np.testing.assert_array_almost_equal(rho_dense, rho_dense.conj().T)
@@ -44,3 +50,43 @@ def test_diagonal_mpa(nr_sites, local_dim, _, rgen, dtype):
 
     if nr_sites > 1:
         assert max(mpa_mp.ranks) == local_dim
+
+
+@pt.mark.parametrize('dtype', pt.MP_TEST_DTYPES)
+def test_random_mpa_randstate(dtype):
+    mpa1 = factory.random_mpa(3, 2, 2, randstate=np.random.default_rng(1234),
+                              dtype=dtype)
+    mpa2 = factory.random_mpa(3, 2, 2, randstate=1234, dtype=dtype)
+    assert mpa1.dtype == dtype
+    assert_array_almost_equal(mpa1.to_array(), mpa2.to_array())
+
+    mpa3 = factory.random_mpa(3, 2, 2, randstate=np.random.RandomState(1234),
+                              dtype=dtype)
+    assert mpa3.dtype == dtype
+
+
+@pt.mark.parametrize('dtype', [np.float32, np.complex64])
+@pt.mark.parametrize('randstate', [np.random.RandomState(1234),
+                                   np.random.default_rng(1234)])
+def test_random_mpa_single_precision(dtype, randstate):
+    mpa = factory.random_mpa(3, 2, 2, randstate=randstate, normalized=True,
+                             dtype=dtype)
+    assert mpa.dtype == dtype
+    assert all(lt.dtype == dtype for lt in mpa.lt)
+    assert abs(mp.norm(mpa) - 1) < 1e-5
+
+
+@pt.mark.parametrize('sites, ldim, intlen', [(4, 2, 2), (5, 3, 2), (4, 2, 3)])
+def test_random_local_ham_randstate(sites, ldim, intlen):
+    ham1 = factory.random_local_ham(sites, ldim, intlen,
+                                    randstate=np.random.RandomState(1234))
+    ham2 = factory.random_local_ham(sites, ldim, intlen,
+                                    randstate=np.random.RandomState(1234))
+    assert_array_equal(ham1.to_array(), ham2.to_array())
+
+    ham1 = factory.random_local_ham(sites, ldim, intlen, randstate=1234)
+    ham2 = factory.random_local_ham(sites, ldim, intlen, randstate=1234)
+    assert_array_equal(ham1.to_array(), ham2.to_array())
+
+    ham_array = ham1.to_array_global().reshape((ldim**sites,) * 2)
+    assert_array_almost_equal(ham_array, ham_array.conj().T)
@@ -26,6 +26,21 @@ def test_iter_readonly():
         raise AssertionError("Iterator over ltens should be read only")
 
 
+def test_version():
+    mpa = factory.random_mpa(4, 2, 3)
+    version = mpa.lt.version
+    mpa.lt[1] = 2 * mpa.lt[1]
+    assert mpa.lt.version > version
+    version = mpa.lt.version
+    mpa.lt.update(slice(0, 2), list(mpa.lt[:2]))
+    assert mpa.lt.version > version
+    # Read access must not change the version
+    version = mpa.lt.version
+    list(mpa.lt)
+    mpa.lt[0]
+    assert mpa.lt.version == version
+
+
 UPDATE_N_SITES = 4
 
 
@@ -136,6 +136,18 @@ def test_povm_probability_map(local_dim, nopovm, rgen):
     assert_array_almost_equal(probab_pmap, probab_direct)
 
 
+def test_mppovm_probability_map_cache():
+    mpp = povm.pauli_mpp(3, 2)
+    pmap = mpp.probability_map
+    pmap_array = pmap.to_array()
+    # In-place operations on the result must not modify the cached map
+    pmap *= 2
+    assert_array_almost_equal(mpp.probability_map.to_array(), pmap_array)
+    # Replacing local tensors of the MPPovm must invalidate the cache
+    mpp *= 3
+    assert_array_almost_equal(mpp.probability_map.to_array(), 3 * pmap_array)
+
+
 @pt.mark.parametrize('nr_sites, width, local_dim, rank',
                      [(6, 3, 2, 5), (4, 2, 3, 4)])
 def test_mppovm_expectation(nr_sites, width, local_dim, rank, nopovm, rgen):